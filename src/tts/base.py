@@ -1,16 +1,86 @@
 """
 Base TTS interface for swappable implementations.
 """
+import functools
+import os
+import shutil
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Optional
 
 from ..agents.debate_orchestrator import DebateLine
+from ..shared.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def disk_cached(
+    key: Callable[..., str],
+    suffix: str = ".wav"
+) -> Callable:
+    """
+    Decorator caching synthesize() results on disk.
+
+    The wrapped provider's cache_dir attribute enables the cache; when it
+    is None the call goes straight through. On a hit the cached file is
+    copied to output_path without calling the provider, on a miss the
+    result is stored under cache_dir/<key><suffix> and the directory is
+    trimmed with TTSProvider.prune_cache(). Hits refresh the entry's
+    mtime so pruning keeps recently used audio.
+
+    Args:
+        key: Function (self, text, speaker, output_path) -> cache key.
+            Must cover every parameter that changes the audio.
+        suffix: Cached file extension
+
+    Returns:
+        Decorator function
+    """
+    def decorator(func: Callable[..., Path]) -> Callable[..., Path]:
+        @functools.wraps(func)
+        def wrapper(
+            self: "TTSProvider",
+            text: str,
+            speaker: str,
+            output_path: Path
+        ) -> Path:
+            if self.cache_dir is None:
+                return func(self, text, speaker, output_path)
+
+            cache_path = Path(self.cache_dir) / (
+                key(self, text, speaker, output_path) + suffix
+            )
+            if cache_path.exists():
+                logger.debug(f"TTS cache hit for {speaker}: {cache_path.name}")
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(cache_path, output_path)
+                os.utime(cache_path)
+                return output_path
+
+            result = func(self, text, speaker, output_path)
+
+            # Write via temp file so a crash never leaves a partial entry
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f".{cache_path.name}.tmp")
+            shutil.copyfile(result, tmp_path)
+            os.replace(tmp_path, cache_path)
+            self.prune_cache()
+            return result
+
+        return wrapper
+
+    return decorator
 
 
 class TTSProvider(ABC):
     """Abstract base class for TTS providers."""
 
+    # Directory for disk_cached results (None disables caching)
+    cache_dir: Optional[Path] = None
+
+    # Cached results kept in cache_dir (a few dozen episodes of lines)
+    MAX_CACHED_FILES = 512
+
     @abstractmethod
     def synthesize(
         self,
@@ -55,3 +125,30 @@ class TTSProvider(ABC):
             audio_files.append(output_path)
 
         return audio_files
+
+    def prune_cache(self, max_files: Optional[int] = None) -> None:
+        """
+        Remove least recently used cache entries beyond max_files.
+
+        Args:
+            max_files: Number of cached files to keep
+                (defaults to MAX_CACHED_FILES)
+        """
+        if self.cache_dir is None or not Path(self.cache_dir).exists():
+            return
+        if max_files is None:
+            max_files = self.MAX_CACHED_FILES
+
+        files = sorted(
+            (
+                path for path in Path(self.cache_dir).iterdir()
+                if path.is_file() and not path.name.startswith(".")
+            ),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True
+        )
+        stale = files[max_files:]
+        for path in stale:
+            path.unlink()
+        if stale:
+            logger.debug(f"Pruned {len(stale)} cached TTS files")
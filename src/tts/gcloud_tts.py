@@ -3,6 +3,7 @@ Google Cloud Text-to-Speech provider.
 
 API docs: https://cloud.google.com/text-to-speech/docs
 """
+import hashlib
 import re
 from pathlib import Path
 from typing import Optional, Dict
@@ -10,7 +11,7 @@ from typing import Optional, Dict
 from google.cloud import texttospeech
 from google.api_core import exceptions as google_exceptions
 
-from .base import TTSProvider
+from .base import TTSProvider, disk_cached
 from ..shared.logger import get_logger
 from ..shared.retry import retry_on_api_error
 
@@ -37,12 +38,17 @@ class GoogleCloudTTSProvider(TTSProvider):
     pointing to a service account JSON file.
     """
 
+    # Output format requested from the API (part of the cache key)
+    AUDIO_ENCODING = texttospeech.AudioEncoding.LINEAR16
+    SAMPLE_RATE_HERTZ = 24000
+
     def __init__(
         self,
         voice_name: str = "ja-JP-Neural2-C",
         language_code: str = "ja-JP",
         speaking_rate: float = 1.0,
         pitch: float = 0.0,
+        cache_dir: Optional[Path] = None,
         **kwargs
     ):
         """
@@ -53,6 +59,8 @@ class GoogleCloudTTSProvider(TTSProvider):
             language_code: Language code (e.g., "ja-JP")
             speaking_rate: Speech speed (0.25 to 4.0, default 1.0)
             pitch: Voice pitch (-20.0 to 20.0, default 0.0)
+            cache_dir: Directory for cached synthesis results
+                (None disables caching)
             **kwargs: Additional parameters
 
         Raises:
@@ -62,6 +70,7 @@ class GoogleCloudTTSProvider(TTSProvider):
         self.language_code = language_code
         self.speaking_rate = speaking_rate
         self.pitch = pitch
+        self.cache_dir = cache_dir
         self.kwargs = kwargs
 
         try:
@@ -107,6 +116,17 @@ class GoogleCloudTTSProvider(TTSProvider):
 
         return ssml
 
+    def _cache_key(self, text: str, speaker: str, output_path: Path) -> str:
+        """Build cache key from voice, output format and the sent SSML."""
+        payload = (
+            f"{self.voice_name}|{self.language_code}|"
+            f"{self.speaking_rate}|{self.pitch}|"
+            f"{self.AUDIO_ENCODING.name}|{self.SAMPLE_RATE_HERTZ}|"
+            f"{self._text_to_ssml(text)}"
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @disk_cached(key=_cache_key)
     @retry_on_api_error(max_attempts=3, min_wait=1)
     def synthesize(
         self,
@@ -150,8 +170,8 @@ class GoogleCloudTTSProvider(TTSProvider):
 
             # Configure audio output
             audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.LINEAR16,
-                sample_rate_hertz=24000,
+                audio_encoding=self.AUDIO_ENCODING,
+                sample_rate_hertz=self.SAMPLE_RATE_HERTZ,
                 speaking_rate=self.speaking_rate,
                 pitch=self.pitch
             )
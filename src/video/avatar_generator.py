@@ -2,16 +2,27 @@
 Generate avatar images for each AI speaker.
 
 Creates simple, clean avatar images with speaker name and themed colors.
+Rendered avatars are cached on disk under a hash of their inputs, so
+repeated runs only pay for a file existence check.
 """
+import functools
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 from ..shared.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Drawing primitive: (ImageDraw method, xy, kwargs)
+Shape = Tuple[str, Any, Dict[str, Any]]
+
 
 class AvatarGenerator:
     """Generate avatar images for debate speakers."""
@@ -37,6 +48,25 @@ class AvatarGenerator:
 
     DEFAULT_SIZE = (1920, 1080)
 
+    FONT_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+    FONT_REGULAR = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+    # Tile the character is rasterized on, and its center within the tile
+    CHARACTER_TILE = (640, 560)
+    CHARACTER_CENTER = (320, 330)
+
+    # Sparkle positions around Gemini, relative to the character center
+    GEMINI_SPARKLE_OFFSETS = ((-280, -100), (280, -100), (-250, 150), (250, 150))
+
+    # Bump when the drawing code changes so cached avatars are re-rendered
+    CACHE_VERSION = 3
+
+    # Side index mapping speaker -> current avatar filename
+    INDEX_FILENAME = "index.json"
+
+    # Cached avatar files kept on disk (least recently used are removed)
+    MAX_CACHED_AVATARS = 32
+
     def __init__(self, output_dir: Path):
         """
         Initialize avatar generator.
@@ -64,38 +94,60 @@ class AvatarGenerator:
         Returns:
             Path to generated image
         """
-        output_path = self.output_dir / f"avatar_{speaker}.png"
+        output_path = self._render_avatar(speaker, character, size)
+        self._update_index({speaker: output_path})
+        return output_path
+
+    def _render_avatar(
+        self,
+        speaker: str,
+        character: Dict[str, Any],
+        size: tuple[int, int] = DEFAULT_SIZE
+    ) -> Path:
+        """
+        Render avatar image to the cache unless it already exists.
+
+        Does not touch the side index, so it is safe to run in worker
+        processes.
+
+        Args:
+            speaker: Speaker name (chatgpt, gemini, claude)
+            character: Character configuration
+            size: Image size (width, height)
+
+        Returns:
+            Path to rendered image
+        """
+        output_path = self.avatar_path(speaker, character, size)
+
+        # Reuse cached avatar if inputs are unchanged
+        if output_path.exists():
+            logger.debug(f"Using cached avatar for {speaker}: {output_path}")
+            self._touch(output_path)
+            return output_path
 
-        # Always regenerate to ensure latest design
         logger.info(f"Generating personified avatar for {speaker}...")
 
         # Get colors
         colors = self.COLORS.get(speaker, self.COLORS["chatgpt"])
 
-        # Create image with gradient background
-        img = Image.new("RGB", size, colors["background"])
-        draw = ImageDraw.Draw(img)
-
-        # Draw gradient background
-        for y in range(size[1]):
-            alpha = y / size[1]
-            # Blend from background to accent
-            draw.line(
-                [(0, y), (size[0], y)],
-                fill=self._blend_color(
-                    colors["background"],
-                    colors["accent"],
-                    alpha * 0.3
-                )
-            )
+        # Create canvas with gradient background
+        canvas = self._gradient(colors, size)
 
         # Draw personified character based on speaker
         if speaker == "chatgpt":
-            self._draw_chatgpt_character(draw, size, colors)
+            shapes = self._chatgpt_character_shapes(colors)
         elif speaker == "gemini":
-            self._draw_gemini_character(draw, size, colors)
+            shapes = self._gemini_character_shapes(colors)
         elif speaker == "claude":
-            self._draw_claude_character(draw, size, colors)
+            shapes = self._claude_character_shapes(colors)
+        else:
+            shapes = []
+        self._composite_shapes(canvas, shapes)
+
+        # Text stays on PIL (one call per string)
+        img = Image.fromarray(canvas, "RGB")
+        draw = ImageDraw.Draw(img)
 
         # Get text to display
         ai_name = character.get("ai_name", speaker.upper())
@@ -105,27 +157,18 @@ class AvatarGenerator:
         # Try to load font (use default if not available)
         try:
             # Try common system fonts
-            font_large = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-                120
-            )
-            font_medium = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                60
-            )
-            font_small = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                40
-            )
+            font_large = self._font(self.FONT_BOLD, 120)
+            font_medium = self._font(self.FONT_REGULAR, 60)
+            font_small = self._font(self.FONT_REGULAR, 40)
         except OSError:
             logger.warning("System font not found, using default")
-            font_large = ImageFont.load_default()
-            font_medium = ImageFont.load_default()
-            font_small = ImageFont.load_default()
+            font_large = self._default_font()
+            font_medium = self._default_font()
+            font_small = self._default_font()
 
         # Draw AI name in center
         ai_text = ai_name
-        bbox = draw.textbbox((0, 0), ai_text, font=font_large)
+        bbox = self._text_bbox(font_large, ai_text)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
         x = (size[0] - text_width) // 2
@@ -148,7 +191,7 @@ class AvatarGenerator:
 
         # Draw persona name
         persona_text = f"aka {persona_name}"
-        bbox = draw.textbbox((0, 0), persona_text, font=font_medium)
+        bbox = self._text_bbox(font_medium, persona_text)
         text_width = bbox[2] - bbox[0]
         x = (size[0] - text_width) // 2
         y = (size[1] - text_height) // 2 + 50
@@ -162,15 +205,7 @@ class AvatarGenerator:
 
         # Draw company name at bottom
         if company:
-            try:
-                font_small = ImageFont.truetype(
-                    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                    40
-                )
-            except OSError:
-                font_small = ImageFont.load_default()
-
-            bbox = draw.textbbox((0, 0), company, font=font_small)
+            bbox = self._text_bbox(font_small, company)
             text_width = bbox[2] - bbox[0]
             x = (size[0] - text_width) // 2
             y = size[1] - 100
@@ -182,12 +217,138 @@ class AvatarGenerator:
                 fill=colors["text"]
             )
 
-        # Save image
-        img.save(output_path, "PNG", quality=95)
+        # Save image (light compression: FFmpeg decodes it right away and
+        # flat-color avatars stay small even at level 1)
+        img.save(output_path, "PNG", compress_level=1, optimize=False)
         logger.info(f"Saved avatar to {output_path}")
 
         return output_path
 
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _font(path: str, size: int) -> ImageFont.FreeTypeFont:
+        """
+        Load TrueType font, cached per (path, size).
+
+        Args:
+            path: Font file path
+            size: Font size in pixels
+
+        Returns:
+            Loaded font
+
+        Raises:
+            OSError: If the font file cannot be loaded
+        """
+        return ImageFont.truetype(path, size)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _default_font() -> Any:
+        """
+        Load PIL's built-in fallback font once.
+
+        Returns:
+            Default font
+        """
+        return ImageFont.load_default()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _text_bbox(font: Any, text: str) -> tuple[int, int, int, int]:
+        """
+        Get bounding box of text drawn at the origin, cached per font.
+
+        Fonts come from _font or _default_font, both memoized, so the
+        same font object is reused and serves as a stable cache key.
+
+        Args:
+            font: PIL font
+            text: Text to measure
+
+        Returns:
+            (left, top, right, bottom) bounding box
+        """
+        left, top, right, bottom = font.getbbox(text)
+        return (int(left), int(top), int(right), int(bottom))
+
+    def avatar_path(
+        self,
+        speaker: str,
+        character: Dict[str, Any],
+        size: tuple[int, int] = DEFAULT_SIZE
+    ) -> Path:
+        """
+        Get content-addressed cache path for an avatar.
+
+        The filename embeds a hash of the speaker, character configuration,
+        image size and CACHE_VERSION, so any change yields a new file.
+
+        Args:
+            speaker: Speaker name
+            character: Character configuration
+            size: Image size (width, height)
+
+        Returns:
+            Path where the avatar is (or will be) stored
+        """
+        payload = json.dumps(
+            {
+                **character,
+                "speaker": speaker,
+                "size": list(size),
+                "v": self.CACHE_VERSION,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        key = hashlib.blake2b(payload.encode("utf-8")).hexdigest()[:16]
+        return self.output_dir / f"avatar_{speaker}_{key}.png"
+
+    def load_index(self) -> Dict[str, Path]:
+        """
+        Load mapping of speaker to current avatar path.
+
+        Returns:
+            Dictionary mapping speaker name to avatar path
+            (only entries whose file still exists)
+        """
+        index_path = self.output_dir / self.INDEX_FILENAME
+        if not index_path.exists():
+            return {}
+
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Failed to read avatar index {index_path}: {e}")
+            return {}
+
+        avatars = {}
+        for speaker, filename in data.items():
+            path = self.output_dir / filename
+            if path.exists():
+                avatars[speaker] = path
+        return avatars
+
+    def _update_index(self, avatars: Dict[str, Path]) -> None:
+        """
+        Record current avatar files in the side index.
+
+        Args:
+            avatars: Dictionary mapping speaker name to avatar path
+        """
+        index = {
+            speaker: path.name
+            for speaker, path in self.load_index().items()
+        }
+        index.update({speaker: path.name for speaker, path in avatars.items()})
+
+        index_path = self.output_dir / self.INDEX_FILENAME
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=2, sort_keys=True)
+
     def generate_all_avatars(
         self,
         characters: Dict[str, Dict[str, Any]]
@@ -195,6 +356,10 @@ class AvatarGenerator:
         """
         Generate avatars for all speakers.
 
+        Cached avatars are returned without any rendering; only missing
+        ones are rendered, in parallel worker processes (PIL drawing and
+        PNG encoding are CPU-bound).
+
         Args:
             characters: Dictionary of character configurations
 
@@ -202,237 +367,320 @@ class AvatarGenerator:
             Dictionary mapping speaker name to avatar path
         """
         avatars = {}
+        missing = {}
 
         for speaker, character in characters.items():
-            avatar_path = self.generate_avatar(speaker, character)
-            avatars[speaker] = avatar_path
-
-        logger.info(f"Generated {len(avatars)} avatar images")
+            avatar_path = self.avatar_path(speaker, character)
+            if avatar_path.exists():
+                self._touch(avatar_path)
+                avatars[speaker] = avatar_path
+            else:
+                missing[speaker] = character
+
+        if missing:
+            with ProcessPoolExecutor(max_workers=len(missing)) as executor:
+                futures = {
+                    speaker: executor.submit(
+                        self._render_avatar,
+                        speaker,
+                        character
+                    )
+                    for speaker, character in missing.items()
+                }
+                for speaker, future in futures.items():
+                    avatars[speaker] = future.result()
+
+        # Keep caller's speaker order
+        avatars = {speaker: avatars[speaker] for speaker in characters}
+
+        if avatars:
+            self._update_index(avatars)
+            self.prune_cache()
+        logger.info(
+            f"Generated {len(missing)} avatar images "
+            f"({len(avatars) - len(missing)} cached)"
+        )
         return avatars
 
-    def _blend_color(
+    def prune_cache(self, max_files: int = MAX_CACHED_AVATARS) -> None:
+        """
+        Remove least recently used avatar files beyond max_files.
+
+        Avatars listed in the side index are always kept.
+
+        Args:
+            max_files: Number of avatar files to keep
+        """
+        current = set(self.load_index().values())
+        files = sorted(
+            self.output_dir.glob("avatar_*.png"),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True
+        )
+        stale = [path for path in files[max_files:] if path not in current]
+        for path in stale:
+            path.unlink()
+        if stale:
+            logger.debug(f"Pruned {len(stale)} cached avatars")
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        """Mark cached file as recently used."""
+        try:
+            os.utime(path)
+        except OSError as e:
+            logger.debug(f"Could not update access time of {path}: {e}")
+
+    def _gradient(
         self,
-        color1: str,
-        color2: str,
-        alpha: float
-    ) -> str:
+        colors: Dict[str, str],
+        size: tuple[int, int]
+    ) -> np.ndarray:
         """
-        Blend two hex colors.
+        Build vertical background gradient as an RGB array.
+
+        Blends from the background color at the top towards the accent
+        color (30% at the bottom) in one vectorized pass.
 
         Args:
-            color1: First color (hex)
-            color2: Second color (hex)
-            alpha: Blend factor (0-1)
+            colors: Color scheme with "background" and "accent" keys
+            size: Image size (width, height)
 
         Returns:
-            Blended color (hex)
+            uint8 array of shape (height, width, 3)
         """
-        # Convert hex to RGB
-        c1 = tuple(int(color1[i:i+2], 16) for i in (1, 3, 5))
-        c2 = tuple(int(color2[i:i+2], 16) for i in (1, 3, 5))
-
-        # Blend
-        blended = tuple(
-            int(c1[i] * (1 - alpha) + c2[i] * alpha)
-            for i in range(3)
-        )
+        width, height = size
+        bg = self._hex_to_rgb(colors["background"])
+        ac = self._hex_to_rgb(colors["accent"])
+
+        # Blend factor per row, matching y / height * 0.3
+        alphas = (np.arange(height, dtype=np.float64) / height * 0.3)[:, None]
+        row = (bg * (1 - alphas) + ac * alphas).astype(np.uint8)
+
+        canvas = np.empty((height, width, 3), dtype=np.uint8)
 
-        # Convert back to hex
-        return f"#{blended[0]:02x}{blended[1]:02x}{blended[2]:02x}"
+        # Fill the first column, then double the filled width each step
+        # (a handful of large block copies instead of a broadcast)
+        canvas[:, 0] = row
+        filled = 1
+        while filled < width:
+            count = min(filled, width - filled)
+            canvas[:, filled:filled + count] = canvas[:, :count]
+            filled += count
+
+        return canvas
+
+    @staticmethod
+    def _hex_to_rgb(color: str) -> np.ndarray:
+        """
+        Convert hex color to RGB array.
+
+        Args:
+            color: Color in "#RRGGBB" form
+
+        Returns:
+            float64 array of (r, g, b)
+        """
+        return np.array(
+            [int(color[i:i+2], 16) for i in (1, 3, 5)],
+            dtype=np.float64
+        )
 
-    def _draw_chatgpt_character(
+    def _composite_shapes(
         self,
-        draw: ImageDraw.ImageDraw,
-        size: tuple[int, int],
-        colors: Dict[str, str]
+        canvas: np.ndarray,
+        shapes: List[Shape]
     ) -> None:
-        """Draw ChatGPT character (GPT Professor with glasses)."""
-        cx, cy = size[0] // 2, size[1] // 2 - 200
+        """
+        Paint character shapes onto the canvas in place.
+
+        All shapes are rasterized in painting order onto one small "L"
+        tile around the character, using palette indices instead of
+        colors, then written into the canvas with a single vectorized
+        lookup.
+
+        Args:
+            canvas: uint8 RGB array of shape (height, width, 3)
+            shapes: (ImageDraw method, xy, kwargs) tuples in tile
+                coordinates; "fill"/"outline" kwargs hold hex colors
+        """
+        height, width = canvas.shape[:2]
+        tile_w, tile_h = self.CHARACTER_TILE
+        tile_cx, tile_cy = self.CHARACTER_CENTER
+
+        # Tile origin on the canvas (character center sits above middle)
+        ox = width // 2 - tile_cx
+        oy = height // 2 - 200 - tile_cy
+
+        # Visible part of the tile
+        x0, y0 = max(ox, 0), max(oy, 0)
+        x1, y1 = min(ox + tile_w, width), min(oy + tile_h, height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        # Index 0 is transparent, 1.. are the colors in use
+        palette: Dict[str, int] = {}
+        tile = Image.new("L", self.CHARACTER_TILE, 0)
+        tile_draw = ImageDraw.Draw(tile)
+        for method, xy, kwargs in shapes:
+            indexed = {
+                key: palette.setdefault(value, len(palette) + 1)
+                if key in ("fill", "outline") else value
+                for key, value in kwargs.items()
+            }
+            getattr(tile_draw, method)(xy, **indexed)
+
+        visible = tile.crop((x0 - ox, y0 - oy, x1 - ox, y1 - oy))
+        bbox = visible.getbbox()
+        if bbox is None:
+            return
+
+        lut = np.zeros((len(palette) + 1, 3), dtype=np.uint8)
+        for color, index in palette.items():
+            lut[index] = self._hex_to_rgb(color)
+
+        bx0, by0, bx1, by1 = bbox
+        indices = np.asarray(visible.crop(bbox))
+        region = canvas[y0 + by0:y0 + by1, x0 + bx0:x0 + bx1]
+        np.copyto(
+            region,
+            np.take(lut, indices, axis=0),
+            where=(indices > 0)[..., None]
+        )
+
+    def _chatgpt_character_shapes(self, colors: Dict[str, str]) -> List[Shape]:
+        """Build ChatGPT character (GPT Professor with glasses)."""
+        cx, cy = self.CHARACTER_CENTER
 
         # Face (circle)
         face_radius = 200
-        draw.ellipse(
-            [cx - face_radius, cy - face_radius,
-             cx + face_radius, cy + face_radius],
-            fill="#FFFFFF",
-            outline=colors["accent"],
-            width=8
-        )
 
         # Glasses (two circles connected)
         glass_radius = 60
         glass_y_offset = -20
-        # Left glass
-        draw.ellipse(
-            [cx - 120 - glass_radius, cy + glass_y_offset - glass_radius,
-             cx - 120 + glass_radius, cy + glass_y_offset + glass_radius],
-            outline=colors["accent"],
-            width=6
-        )
-        # Right glass
-        draw.ellipse(
-            [cx + 120 - glass_radius, cy + glass_y_offset - glass_radius,
-             cx + 120 + glass_radius, cy + glass_y_offset + glass_radius],
-            outline=colors["accent"],
-            width=6
-        )
-        # Bridge
-        draw.line(
-            [cx - 60, cy + glass_y_offset, cx + 60, cy + glass_y_offset],
-            fill=colors["accent"],
-            width=6
-        )
 
         # Eyes (behind glasses)
         eye_radius = 15
-        # Left eye
-        draw.ellipse(
-            [cx - 120 - eye_radius, cy + glass_y_offset - eye_radius,
-             cx - 120 + eye_radius, cy + glass_y_offset + eye_radius],
-            fill="#000000"
-        )
-        # Right eye
-        draw.ellipse(
-            [cx + 120 - eye_radius, cy + glass_y_offset - eye_radius,
-             cx + 120 + eye_radius, cy + glass_y_offset + eye_radius],
-            fill="#000000"
-        )
 
-        # Smile (arc)
-        draw.arc(
-            [cx - 80, cy + 30, cx + 80, cy + 120],
-            start=0,
-            end=180,
-            fill=colors["accent"],
-            width=8
-        )
+        return [
+            ("ellipse",
+             [cx - face_radius, cy - face_radius,
+              cx + face_radius, cy + face_radius],
+             {"fill": "#FFFFFF", "outline": colors["accent"], "width": 8}),
+            # Left glass
+            ("ellipse",
+             [cx - 120 - glass_radius, cy + glass_y_offset - glass_radius,
+              cx - 120 + glass_radius, cy + glass_y_offset + glass_radius],
+             {"outline": colors["accent"], "width": 6}),
+            # Right glass
+            ("ellipse",
+             [cx + 120 - glass_radius, cy + glass_y_offset - glass_radius,
+              cx + 120 + glass_radius, cy + glass_y_offset + glass_radius],
+             {"outline": colors["accent"], "width": 6}),
+            # Bridge
+            ("line",
+             [cx - 60, cy + glass_y_offset, cx + 60, cy + glass_y_offset],
+             {"fill": colors["accent"], "width": 6}),
+            # Left eye
+            ("ellipse",
+             [cx - 120 - eye_radius, cy + glass_y_offset - eye_radius,
+              cx - 120 + eye_radius, cy + glass_y_offset + eye_radius],
+             {"fill": "#000000"}),
+            # Right eye
+            ("ellipse",
+             [cx + 120 - eye_radius, cy + glass_y_offset - eye_radius,
+              cx + 120 + eye_radius, cy + glass_y_offset + eye_radius],
+             {"fill": "#000000"}),
+            # Smile (arc)
+            ("arc",
+             [cx - 80, cy + 30, cx + 80, cy + 120],
+             {"start": 0, "end": 180, "fill": colors["accent"], "width": 8}),
+        ]
 
-    def _draw_gemini_character(
-        self,
-        draw: ImageDraw.ImageDraw,
-        size: tuple[int, int],
-        colors: Dict[str, str]
-    ) -> None:
-        """Draw Gemini character (energetic star-shaped character)."""
-        cx, cy = size[0] // 2, size[1] // 2 - 200
+    def _gemini_character_shapes(self, colors: Dict[str, str]) -> List[Shape]:
+        """Build Gemini character (energetic star-shaped character)."""
+        cx, cy = self.CHARACTER_CENTER
 
-        # Star-shaped body
-        star_points = []
+        # Star-shaped body (outer and inner vertices alternate)
         num_points = 5
         outer_radius = 220
         inner_radius = 100
 
-        for i in range(num_points * 2):
-            angle = i * 3.14159 / num_points - 3.14159 / 2
-            if i % 2 == 0:
-                radius = outer_radius
-            else:
-                radius = inner_radius
-            x = cx + int(radius * __import__('math').cos(angle))
-            y = cy + int(radius * __import__('math').sin(angle))
-            star_points.append((x, y))
-
-        # Draw star
-        draw.polygon(star_points, fill="#FFFFFF", outline=colors["accent"], width=8)
-
-        # Face on the star
-        # Happy eyes (^_^)
-        draw.arc(
-            [cx - 70, cy - 30, cx - 30, cy - 10],
-            start=180,
-            end=360,
-            fill="#000000",
-            width=6
-        )
-        draw.arc(
-            [cx + 30, cy - 30, cx + 70, cy - 10],
-            start=180,
-            end=360,
-            fill="#000000",
-            width=6
-        )
-
-        # Big smile
-        draw.arc(
-            [cx - 90, cy + 10, cx + 90, cy + 100],
-            start=0,
-            end=180,
-            fill=colors["accent"],
-            width=10
-        )
+        vertex = np.arange(num_points * 2)
+        angles = vertex * np.pi / num_points - np.pi / 2
+        radii = np.where(vertex % 2 == 0, outer_radius, inner_radius)
+        xs = cx + (radii * np.cos(angles)).astype(int)
+        ys = cy + (radii * np.sin(angles)).astype(int)
+        star_points = list(zip(xs.tolist(), ys.tolist()))
+
+        shapes: List[Shape] = [
+            # Draw star
+            ("polygon", star_points,
+             {"fill": "#FFFFFF", "outline": colors["accent"], "width": 8}),
+            # Face on the star
+            # Happy eyes (^_^)
+            ("arc",
+             [cx - 70, cy - 30, cx - 30, cy - 10],
+             {"start": 180, "end": 360, "fill": "#000000", "width": 6}),
+            ("arc",
+             [cx + 30, cy - 30, cx + 70, cy - 10],
+             {"start": 180, "end": 360, "fill": "#000000", "width": 6}),
+            # Big smile
+            ("arc",
+             [cx - 90, cy + 10, cx + 90, cy + 100],
+             {"start": 0, "end": 180, "fill": colors["accent"], "width": 10}),
+        ]
 
         # Sparkles around
-        sparkle_positions = [
-            (cx - 280, cy - 100),
-            (cx + 280, cy - 100),
-            (cx - 250, cy + 150),
-            (cx + 250, cy + 150)
-        ]
-        for sx, sy in sparkle_positions:
+        for dx, dy in self.GEMINI_SPARKLE_OFFSETS:
+            sx, sy = cx + dx, cy + dy
             # Small star sparkle
-            draw.line([sx - 15, sy, sx + 15, sy], fill="#FFFF00", width=4)
-            draw.line([sx, sy - 15, sx, sy + 15], fill="#FFFF00", width=4)
+            shapes.append(("line", [sx - 15, sy, sx + 15, sy],
+                           {"fill": "#FFFF00", "width": 4}))
+            shapes.append(("line", [sx, sy - 15, sx, sy + 15],
+                           {"fill": "#FFFF00", "width": 4}))
 
-    def _draw_claude_character(
-        self,
-        draw: ImageDraw.ImageDraw,
-        size: tuple[int, int],
-        colors: Dict[str, str]
-    ) -> None:
-        """Draw Claude character (wise, calm character)."""
-        cx, cy = size[0] // 2, size[1] // 2 - 200
+        return shapes
+
+    def _claude_character_shapes(self, colors: Dict[str, str]) -> List[Shape]:
+        """Build Claude character (wise, calm character)."""
+        cx, cy = self.CHARACTER_CENTER
 
         # Face (rounded square for sophistication)
         face_size = 350
-        draw.rounded_rectangle(
-            [cx - face_size // 2, cy - face_size // 2,
-             cx + face_size // 2, cy + face_size // 2],
-            radius=50,
-            fill="#FFFFFF",
-            outline=colors["accent"],
-            width=8
-        )
 
         # Calm, intelligent eyes
         eye_y = cy - 40
-        # Left eye
-        draw.ellipse(
-            [cx - 100 - 25, eye_y - 15, cx - 100 + 25, eye_y + 15],
-            fill="#000000"
-        )
-        # Right eye
-        draw.ellipse(
-            [cx + 100 - 25, eye_y - 15, cx + 100 + 25, eye_y + 15],
-            fill="#000000"
-        )
-
-        # Slight smile (subtle)
-        draw.arc(
-            [cx - 70, cy + 40, cx + 70, cy + 100],
-            start=0,
-            end=180,
-            fill=colors["accent"],
-            width=6
-        )
 
         # Thought symbol (cloud above head)
         cloud_y = cy - face_size // 2 - 120
-        # Three circles forming a thought cloud
-        draw.ellipse(
-            [cx - 60, cloud_y, cx - 10, cloud_y + 50],
-            fill="#FFFFFF",
-            outline=colors["accent"],
-            width=4
-        )
-        draw.ellipse(
-            [cx - 10, cloud_y - 20, cx + 50, cloud_y + 40],
-            fill="#FFFFFF",
-            outline=colors["accent"],
-            width=4
-        )
-        draw.ellipse(
-            [cx + 20, cloud_y, cx + 70, cloud_y + 50],
-            fill="#FFFFFF",
-            outline=colors["accent"],
-            width=4
-        )
+
+        return [
+            ("rounded_rectangle",
+             [cx - face_size // 2, cy - face_size // 2,
+              cx + face_size // 2, cy + face_size // 2],
+             {"radius": 50, "fill": "#FFFFFF",
+              "outline": colors["accent"], "width": 8}),
+            # Left eye
+            ("ellipse",
+             [cx - 100 - 25, eye_y - 15, cx - 100 + 25, eye_y + 15],
+             {"fill": "#000000"}),
+            # Right eye
+            ("ellipse",
+             [cx + 100 - 25, eye_y - 15, cx + 100 + 25, eye_y + 15],
+             {"fill": "#000000"}),
+            # Slight smile (subtle)
+            ("arc",
+             [cx - 70, cy + 40, cx + 70, cy + 100],
+             {"start": 0, "end": 180, "fill": colors["accent"], "width": 6}),
+            # Three circles forming a thought cloud
+            ("ellipse",
+             [cx - 60, cloud_y, cx - 10, cloud_y + 50],
+             {"fill": "#FFFFFF", "outline": colors["accent"], "width": 4}),
+            ("ellipse",
+             [cx - 10, cloud_y - 20, cx + 50, cloud_y + 40],
+             {"fill": "#FFFFFF", "outline": colors["accent"], "width": 4}),
+            ("ellipse",
+             [cx + 20, cloud_y, cx + 70, cloud_y + 50],
+             {"fill": "#FFFFFF", "outline": colors["accent"], "width": 4}),
+        ]
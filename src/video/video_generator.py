@@ -2,8 +2,14 @@
 Generate video from debate script and audio.
 
 Creates video with speaker-switching avatars synchronized to audio.
+The whole video is rendered by a single FFmpeg invocation: each avatar
+still is decoded once, repeated per segment inside the filter graph and
+encoded exactly once.
 """
+import hashlib
 import subprocess
+import time
+import wave
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -14,13 +20,40 @@ from .avatar_generator import AvatarGenerator
 logger = get_logger(__name__)
 
 
+def escape_filter_value(value: str) -> str:
+    """
+    Escape a value for use as a filter option inside a filter graph.
+
+    Applies both FFmpeg escaping levels: first for the option value
+    (backslash, quote, colon), then for the filter graph description
+    (backslash, quote, brackets, comma, semicolon).
+
+    Args:
+        value: Raw option value (e.g. a file path)
+
+    Returns:
+        Escaped value safe to embed in -filter_complex
+    """
+    for char in "\\':":
+        value = value.replace(char, "\\" + char)
+    for char in "\\'[],;":
+        value = value.replace(char, "\\" + char)
+    return value
+
+
 class VideoGenerator:
     """Generate video with speaker transitions."""
 
+    DEFAULT_FPS = 30
+
+    FONT_FILE = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
     def __init__(
         self,
         work_dir: Path,
-        characters: Dict[str, Dict]
+        characters: Dict[str, Dict],
+        avatar_dir: Optional[Path] = None,
+        fps: int = DEFAULT_FPS
     ):
         """
         Initialize video generator.
@@ -28,13 +61,21 @@ class VideoGenerator:
         Args:
             work_dir: Working directory for video generation
             characters: Character configurations
+            avatar_dir: Avatar cache directory (defaults to work_dir/avatars).
+                Share it across episodes to reuse rendered avatars.
+            fps: Output frame rate
         """
         self.work_dir = work_dir
         self.work_dir.mkdir(parents=True, exist_ok=True)
         self.characters = characters
+        self.fps = fps
+
+        # Number of FFmpeg/FFprobe processes spawned (for render statistics)
+        self._process_count = 0
 
         # Create avatar generator
-        avatar_dir = work_dir / "avatars"
+        if avatar_dir is None:
+            avatar_dir = work_dir / "avatars"
         self.avatar_gen = AvatarGenerator(avatar_dir)
 
     def generate_video(
@@ -57,12 +98,14 @@ class VideoGenerator:
             Path to generated video
         """
         logger.info("Generating video from debate script...")
+        started = time.perf_counter()
+        self._process_count = 0
 
         # Step 1: Generate avatar images
         logger.info("Generating avatar images...")
         avatars = self.avatar_gen.generate_all_avatars(self.characters)
 
-        # Step 2: Create video segments for each speaker
+        # Step 2: Compute timing of each speaker segment
         logger.info("Creating video segments...")
         segment_list = self._create_segment_list(
             script,
@@ -70,14 +113,16 @@ class VideoGenerator:
             audio_stems_dir
         )
 
-        # Step 3: Generate concat file for FFmpeg
-        concat_file = self._create_concat_file(segment_list)
-
-        # Step 4: Use FFmpeg to create video with speaker transitions
+        # Step 3: Render all segments plus audio in one FFmpeg pass
         logger.info("Rendering video with FFmpeg...")
-        self._render_video(concat_file, audio_path, output_path)
+        self._render_video(segment_list, audio_path, output_path)
 
-        logger.info(f"Video generated successfully: {output_path}")
+        logger.info(
+            f"Video generated successfully: {output_path} "
+            f"({len(segment_list)} segments, "
+            f"{self._process_count} FFmpeg/FFprobe processes, "
+            f"{time.perf_counter() - started:.1f}s)"
+        )
         return output_path
 
     def _create_segment_list(
@@ -95,28 +140,46 @@ class VideoGenerator:
             audio_stems_dir: Directory containing individual audio stems
 
         Returns:
-            List of segment info dicts
+            List of segment info dicts; start/duration are aligned to the
+            frame grid and "frames" holds the segment length in frames
         """
+        # Collect stem files first so their durations can be read in one batch
+        audio_files: Dict[int, Path] = {}
+        if audio_stems_dir and audio_stems_dir.exists():
+            for i, line in enumerate(script.lines):
+                audio_file = audio_stems_dir / f"{i:03d}_{line.speaker}.wav"
+                if audio_file.exists():
+                    audio_files[i] = audio_file
+                else:
+                    logger.warning(
+                        f"Audio file not found: {audio_file}, "
+                        f"using estimated duration"
+                    )
+
+        stem_durations = dict(zip(
+            audio_files,
+            self._get_audio_durations(list(audio_files.values()))
+        ))
+
         segments = []
         current_time = 0.0
+        current_frame = 0
 
         for i, line in enumerate(script.lines):
             speaker = line.speaker
 
             # Get actual duration from audio file if available
-            if audio_stems_dir and audio_stems_dir.exists():
-                audio_file = audio_stems_dir / f"{i:03d}_{speaker}.wav"
-                if audio_file.exists():
-                    duration = self._get_audio_duration(audio_file)
-                else:
-                    logger.warning(
-                        f"Audio file not found: {audio_file}, "
-                        f"using estimated duration"
-                    )
-                    duration = line.estimated_duration_sec + line.pause_after_sec
+            if i in stem_durations:
+                duration = stem_durations[i]
             else:
                 duration = line.estimated_duration_sec + line.pause_after_sec
 
+            # Snap segment boundaries to whole frames using the running
+            # total, so rounding never accumulates into audio drift
+            current_time += duration
+            end_frame = max(current_frame + 1, round(current_time * self.fps))
+            frames = end_frame - current_frame
+
             # Get avatar path (fallback to chatgpt if not found)
             avatar_path = avatars.get(
                 speaker,
@@ -126,16 +189,62 @@ class VideoGenerator:
             segments.append({
                 "speaker": speaker,
                 "avatar": avatar_path,
-                "start": current_time,
-                "duration": duration,
+                "start": current_frame / self.fps,
+                "duration": frames / self.fps,
+                "frames": frames,
                 "text": line.text
             })
 
-            current_time += duration
+            current_frame = end_frame
 
         return segments
 
-    def _get_audio_duration(self, audio_file: Path) -> float:
+    def _get_audio_durations(self, audio_files: list[Path]) -> list[float]:
+        """
+        Get durations of several audio files.
+
+        WAV stems are read from their header directly; other formats and
+        unreadable WAV headers fall back to FFprobe.
+
+        Args:
+            audio_files: Paths to audio files
+
+        Returns:
+            Durations in seconds, in the same order as audio_files
+        """
+        durations = []
+        for audio_file in audio_files:
+            duration = self._read_wav_duration(audio_file)
+            if duration is None:
+                self._process_count += 1
+                duration = self._probe_audio_duration(audio_file)
+            durations.append(duration)
+        return durations
+
+    def _read_wav_duration(self, audio_file: Path) -> Optional[float]:
+        """
+        Read duration from a WAV file header.
+
+        Args:
+            audio_file: Path to audio file
+
+        Returns:
+            Duration in seconds, or None if the file is not a readable WAV
+        """
+        if audio_file.suffix.lower() != ".wav":
+            return None
+
+        try:
+            with wave.open(str(audio_file), "rb") as wav:
+                return wav.getnframes() / wav.getframerate()
+        except (wave.Error, EOFError) as e:
+            logger.debug(
+                f"Could not read WAV header of {audio_file} ({e}), "
+                f"falling back to FFprobe"
+            )
+            return None
+
+    def _probe_audio_duration(self, audio_file: Path) -> float:
         """
         Get duration of audio file using FFprobe.
 
@@ -170,122 +279,131 @@ class VideoGenerator:
             # Fallback to estimated duration
             return 5.0
 
-    def _create_concat_file(self, segments: list[dict]) -> Path:
+    def _build_filter_graph(
+        self,
+        segments: list[dict]
+    ) -> tuple[list[Path], str]:
         """
-        Create FFmpeg concat demuxer file.
+        Build FFmpeg filter graph for all segments.
+
+        Each speaker's avatar is a single-frame input that is decoded,
+        labelled with the speaker name and converted to yuv420p once, then
+        split across that speaker's segments. Every segment repeats the
+        prepared frame with the loop filter instead of re-reading the
+        image, so no per-frame filtering happens before the encoder.
 
         Args:
             segments: List of segment info
 
         Returns:
-            Path to concat file
+            Tuple of (still image inputs in input order,
+            filter_complex string producing the [outv] stream)
         """
-        concat_path = self.work_dir / "concat_list.txt"
-
-        # First, create individual segment videos with speaker name overlay
-        segment_videos = []
-
+        # One input per speaker, in order of first appearance
+        speakers: Dict[str, list[int]] = {}
+        stills = []
         for i, seg in enumerate(segments):
-            seg_video = self.work_dir / f"segment_{i:04d}.mp4"
-            segment_videos.append(seg_video)
-
-            # Skip if already exists
-            if seg_video.exists():
-                continue
-
-            # Create video segment with text overlay
-            self._create_segment_video(
-                avatar_path=seg["avatar"],
-                duration=seg["duration"],
-                speaker_name=seg["speaker"].upper(),
-                output_path=seg_video
-            )
-
-        # Create concat file
-        with open(concat_path, 'w', encoding='utf-8') as f:
-            for seg_video in segment_videos:
-                f.write(f"file '{seg_video.absolute()}'\n")
-
-        logger.info(f"Created concat file with {len(segment_videos)} segments")
-        return concat_path
-
-    def _create_segment_video(
-        self,
-        avatar_path: Path,
-        duration: float,
-        speaker_name: str,
-        output_path: Path
-    ) -> None:
-        """
-        Create a single video segment with speaker name overlay.
-
-        Args:
-            avatar_path: Path to avatar image
-            duration: Duration in seconds
-            speaker_name: Speaker name to display
-            output_path: Output video path
-        """
-        # FFmpeg command to create video from image with text overlay
-        cmd = [
-            "ffmpeg",
-            "-y",  # Overwrite output
-            "-loop", "1",
-            "-i", str(avatar_path),
-            "-vf", (
+            if seg["speaker"] not in speakers:
+                speakers[seg["speaker"]] = []
+                stills.append(seg["avatar"])
+            speakers[seg["speaker"]].append(i)
+
+        chains = []
+        labels = {}
+        for k, (speaker, indices) in enumerate(speakers.items()):
+            outputs = [f"[s{k}_{j}]" for j in range(len(indices))]
+            labels.update(zip(indices, outputs))
+            label_file = self._write_label_file(speaker)
+            chains.append(
+                f"[{k}:v]"
                 f"drawtext="
-                f"text='{speaker_name}':"
-                f"fontfile=/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf:"
+                f"textfile={escape_filter_value(str(label_file))}:"
+                f"expansion=none:"
+                f"fontfile={escape_filter_value(self.FONT_FILE)}:"
                 f"fontsize=48:"
                 f"fontcolor=white:"
                 f"x=(w-text_w)/2:"
                 f"y=50:"
                 f"box=1:"
                 f"boxcolor=black@0.6:"
-                f"boxborderw=10"
-            ),
-            "-t", str(duration),
-            "-pix_fmt", "yuv420p",
-            "-c:v", "libx264",
-            "-preset", "ultrafast",
-            "-crf", "23",
-            str(output_path)
-        ]
+                f"boxborderw=10,"
+                f"format=yuv420p,"
+                f"split={len(indices)}{''.join(outputs)}"
+            )
 
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
+        # Repeat the prepared frame for the length of each segment
+        for i, seg in enumerate(segments):
+            frames = seg["frames"]
+            chains.append(
+                f"{labels[i]}"
+                f"loop=loop={frames - 1}:size=1:start=0,"
+                f"setpts=N/({self.fps}*TB)[v{i}]"
             )
-        except subprocess.CalledProcessError as e:
-            logger.error(f"FFmpeg error creating segment: {e.stderr}")
-            raise
+
+        concat_inputs = "".join(f"[v{i}]" for i in range(len(segments)))
+        chains.append(
+            f"{concat_inputs}concat=n={len(segments)}:v=1:a=0[outv]"
+        )
+        return stills, ";".join(chains)
+
+    def _write_label_file(self, speaker: str) -> Path:
+        """
+        Write speaker name overlay text for drawtext's textfile option.
+
+        Reading the label from a file keeps arbitrary speaker names
+        (quotes, colons, non-ASCII) out of the filter graph syntax.
+
+        Args:
+            speaker: Speaker name
+
+        Returns:
+            Path to the text file
+        """
+        label_file = self.work_dir / f"name_{speaker}.txt"
+        label_file.write_text(speaker.upper(), encoding="utf-8")
+        return label_file
 
     def _render_video(
         self,
-        concat_file: Path,
+        segments: list[dict],
         audio_path: Path,
         output_path: Path
     ) -> None:
         """
-        Render final video by concatenating segments and adding audio.
+        Render final video from segments and audio in a single encode.
 
         Args:
-            concat_file: Path to concat file
+            segments: List of segment info
             audio_path: Path to audio file
             output_path: Output video path
         """
-        # FFmpeg command to concatenate video segments and add audio
-        cmd = [
-            "ffmpeg",
-            "-y",
-            "-f", "concat",
-            "-safe", "0",
-            "-i", str(concat_file),
+        if not segments:
+            raise RuntimeError("Failed to render video: script has no lines")
+
+        stills, filter_graph = self._build_filter_graph(segments)
+
+        cmd = ["ffmpeg", "-y"]
+
+        # One single-frame still input per speaker, read at the output
+        # rate so loop/setpts count frames in a 1/fps time base
+        for still in stills:
+            cmd += ["-framerate", str(self.fps), "-i", str(still)]
+
+        cmd += [
             "-i", str(audio_path),
+            "-filter_complex", filter_graph,
+            "-map", "[outv]",
+            "-map", f"{len(stills)}:a",
+            # Constant frame rate output so segment boundaries land on frames
+            "-r", str(self.fps),
+            "-fps_mode", "cfr",
+            "-video_track_timescale", str(self.fps * 512),
+            # Content is static stills: skip motion search, B-frame and
+            # lookahead analysis that find nothing to gain on such frames
             "-c:v", "libx264",
-            "-preset", "medium",
+            "-preset", "veryfast",
+            "-tune", "stillimage",
+            "-x264-params", "me=dia:subme=1:ref=1:bframes=0:rc-lookahead=0",
             "-crf", "23",
             "-c:a", "aac",
             "-b:a", "192k",
@@ -293,7 +411,24 @@ class VideoGenerator:
             str(output_path)
         ]
 
-        logger.info(f"Running FFmpeg to create final video...")
+        # Skip the encode when inputs, timeline and settings are unchanged
+        render_key = self._render_key(cmd, audio_path)
+        key_file = output_path.with_name(f"{output_path.name}.key")
+        if (
+            output_path.exists()
+            and key_file.exists()
+            and key_file.read_text(encoding="utf-8") == render_key
+        ):
+            logger.info(f"Video unchanged, reusing {output_path}")
+            return
+
+        logger.info(
+            f"Running FFmpeg to create final video "
+            f"({len(segments)} segments)..."
+        )
+        # Drop the old key first so a failed encode cannot be reused later
+        key_file.unlink(missing_ok=True)
+        self._process_count += 1
         try:
             result = subprocess.run(
                 cmd,
@@ -306,17 +441,26 @@ class VideoGenerator:
             logger.error(f"FFmpeg error: {e.stderr}")
             raise RuntimeError(f"Failed to render video: {e.stderr}")
 
-    def cleanup_temp_files(self) -> None:
-        """Clean up temporary segment files."""
-        logger.info("Cleaning up temporary video files...")
+        key_file.write_text(render_key, encoding="utf-8")
 
-        # Remove segment videos
-        for seg_file in self.work_dir.glob("segment_*.mp4"):
-            seg_file.unlink()
+    def _render_key(self, cmd: list[str], audio_path: Path) -> str:
+        """
+        Build content key for a render.
+
+        The FFmpeg command already names content-addressed avatars and
+        encodes the full segment timeline and encoder settings; the audio
+        is identified by its bytes, since the mix stage rewrites the file
+        on every run even when nothing changed.
 
-        # Remove concat file
-        concat_file = self.work_dir / "concat_list.txt"
-        if concat_file.exists():
-            concat_file.unlink()
+        Args:
+            cmd: Full FFmpeg command
+            audio_path: Path to audio file
 
-        logger.info("Cleanup complete")
+        Returns:
+            Hex digest identifying the render
+        """
+        digest = hashlib.blake2b("\0".join(cmd).encode("utf-8"))
+        with open(audio_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()[:32]
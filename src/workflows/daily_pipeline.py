@@ -184,12 +184,18 @@ class DailyPipeline:
 
         # Create TTS providers for each speaker based on settings
         tts_providers = {}
+        tts_cache_dir = self.settings.data_dir / "cache" / "tts"
         for speaker, voice_config in self.settings.voices.items():
+            provider_kwargs = {}
+            if voice_config.provider == "gcloud":
+                # Reuse synthesized audio for identical text + voice
+                provider_kwargs["cache_dir"] = tts_cache_dir
             tts_providers[speaker] = create_tts_provider(
                 provider_type=voice_config.provider,
                 voice_name=voice_config.voice_id,
                 speaking_rate=voice_config.speed,
-                pitch=voice_config.pitch or 0.0
+                pitch=voice_config.pitch or 0.0,
+                **provider_kwargs
             )
 
         # Synthesize all lines with speaker-specific providers
@@ -250,7 +256,13 @@ class DailyPipeline:
 
         # Create video generator
         video_work_dir = self.work_dir / "video"
-        video_gen = VideoGenerator(video_work_dir, characters)
+        avatar_dir = self.settings.data_dir / "cache" / "avatars"
+        video_gen = VideoGenerator(
+            video_work_dir,
+            characters,
+            avatar_dir=avatar_dir,
+            fps=self.settings.video.fps
+        )
 
         # Audio stems directory
         audio_stems_dir = self.work_dir / "audio_stems"
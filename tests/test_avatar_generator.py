@@ -0,0 +1,133 @@
+"""
+Test avatar generation and caching.
+"""
+import hashlib
+import json
+import os
+
+import pytest
+from PIL import Image, ImageDraw
+
+from src.video.avatar_generator import AvatarGenerator
+
+
+@pytest.fixture
+def character():
+    """Create sample character configuration."""
+    return {
+        "ai_name": "ChatGPT",
+        "persona_name": "GPT Professor",
+        "company": "OpenAI",
+    }
+
+
+def test_avatar_path_depends_on_inputs(tmp_path, character):
+    """Test cache path changes when character or size changes."""
+    gen = AvatarGenerator(tmp_path)
+
+    path = gen.avatar_path("chatgpt", character)
+    assert path == gen.avatar_path("chatgpt", dict(character))
+    assert path.name.startswith("avatar_chatgpt_")
+
+    changed = {**character, "persona_name": "Someone Else"}
+    assert gen.avatar_path("chatgpt", changed) != path
+    assert gen.avatar_path("chatgpt", character, (640, 360)) != path
+    assert gen.avatar_path("gemini", character) != path
+
+
+def test_generate_avatar_uses_cache(tmp_path, character, mocker):
+    """Test second call reuses the cached file without rendering."""
+    gen = AvatarGenerator(tmp_path)
+    size = (320, 180)
+
+    path = gen.generate_avatar("chatgpt", character, size)
+    assert path.exists()
+    content = path.read_bytes()
+
+    gradient = mocker.spy(gen, "_gradient")
+    assert gen.generate_avatar("chatgpt", character, size) == path
+    assert gradient.call_count == 0
+    assert path.read_bytes() == content
+
+
+def test_index_tracks_current_avatar(tmp_path, character):
+    """Test side index maps speaker to latest avatar file."""
+    gen = AvatarGenerator(tmp_path)
+    size = (320, 180)
+
+    first = gen.generate_avatar("chatgpt", character, size)
+    second = gen.generate_avatar(
+        "chatgpt", {**character, "company": "Other"}, size
+    )
+
+    assert gen.load_index() == {"chatgpt": second}
+    data = json.loads((tmp_path / AvatarGenerator.INDEX_FILENAME).read_text())
+    assert data == {"chatgpt": second.name}
+    assert first.exists()
+
+
+def test_generate_all_avatars_skips_pool_when_cached(tmp_path, character, mocker):
+    """Test fully cached avatars are resolved without worker processes."""
+    gen = AvatarGenerator(tmp_path)
+    characters = {"chatgpt": character}
+
+    first = gen.generate_all_avatars(characters)
+
+    pool = mocker.patch("src.video.avatar_generator.ProcessPoolExecutor")
+    assert gen.generate_all_avatars(characters) == first
+    pool.assert_not_called()
+
+
+def test_prune_cache_keeps_recent_and_indexed(tmp_path, character):
+    """Test pruning removes only old avatars not in the index."""
+    gen = AvatarGenerator(tmp_path)
+    size = (320, 180)
+
+    paths = [
+        gen.generate_avatar("chatgpt", {**character, "company": f"C{i}"}, size)
+        for i in range(4)
+    ]
+    # Oldest first; the index points at the last one generated
+    for age, path in enumerate(reversed(paths)):
+        os.utime(path, (1000 - age, 1000 - age))
+    os.utime(paths[-1], (1, 1))
+
+    gen.prune_cache(max_files=2)
+
+    assert [path.exists() for path in paths] == [False, True, True, True]
+
+
+def test_fallback_font_reused_across_renders(tmp_path, character, mocker):
+    """Test the default font is loaded once so text bboxes stay cached."""
+    mocker.patch.object(AvatarGenerator, "_font", side_effect=OSError)
+    gen = AvatarGenerator(tmp_path)
+
+    gen._render_avatar("chatgpt", character, (320, 180)).unlink()
+    cached = AvatarGenerator._text_bbox.cache_info()
+    gen._render_avatar("chatgpt", character, (320, 180))
+
+    assert AvatarGenerator._default_font() is AvatarGenerator._default_font()
+    assert AvatarGenerator._text_bbox.cache_info().currsize == cached.currsize
+
+
+# SHA-256 of the RGB pixels of each DEFAULT_SIZE avatar without text.
+# chatgpt and claude match the original per-shape PIL drawing; gemini
+# matches it up to the 3.14159 -> np.pi change in its star points.
+AVATAR_PIXEL_DIGESTS = {
+    "chatgpt": "2e1628104ab0e57d81a15d0bfc84f4939fb6768e178138a063253959674d441d",
+    "gemini": "ec58417492b7c17c590d9793c0d871df86ea17ce9f8cbf4ad5d8da91bee37bd7",
+    "claude": "b068ac3310cfc4aac10bf8fa7191b37c594fc27526180f16ce05ff240d9cec4f",
+}
+
+
+@pytest.mark.parametrize("speaker", sorted(AVATAR_PIXEL_DIGESTS))
+def test_character_pixels_unchanged(tmp_path, character, mocker, speaker):
+    """Test gradient and character shapes render pixel-identically."""
+    # Skip text so the digest does not depend on installed fonts
+    mocker.patch.object(ImageDraw.ImageDraw, "text")
+    gen = AvatarGenerator(tmp_path)
+
+    with Image.open(gen.generate_avatar(speaker, character)) as img:
+        digest = hashlib.sha256(img.convert("RGB").tobytes()).hexdigest()
+
+    assert digest == AVATAR_PIXEL_DIGESTS[speaker]
@@ -0,0 +1,120 @@
+"""
+Test disk cache for TTS providers.
+"""
+import enum
+import os
+import sys
+import types
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from src.tts.base import TTSProvider, disk_cached
+
+
+class CountingTTS(TTSProvider):
+    """TTS provider that writes the text and counts calls."""
+
+    def __init__(self, cache_dir=None, voice="a"):
+        self.cache_dir = cache_dir
+        self.voice = voice
+        self.calls = 0
+
+    def _cache_key(self, text, speaker, output_path):
+        return f"{self.voice}-{text}"
+
+    @disk_cached(key=_cache_key)
+    def synthesize(self, text, speaker, output_path):
+        self.calls += 1
+        output_path.write_text(f"{self.voice}:{text}", encoding="utf-8")
+        return output_path
+
+
+@pytest.fixture
+def gcloud_tts(mocker):
+    """Import gcloud_tts with stub Google client modules."""
+    texttospeech = types.ModuleType("google.cloud.texttospeech")
+    texttospeech.AudioEncoding = enum.Enum("AudioEncoding", "LINEAR16")
+    exceptions = types.ModuleType("google.api_core.exceptions")
+    exceptions.GoogleAPIError = type("GoogleAPIError", (Exception,), {})
+    api_core = types.ModuleType("google.api_core")
+    api_core.exceptions = exceptions
+    mocker.patch.dict(sys.modules, {
+        "google.cloud.texttospeech": texttospeech,
+        "google.api_core": api_core,
+        "google.api_core.exceptions": exceptions,
+    })
+    sys.modules.pop("src.tts.gcloud_tts", None)
+
+    from src.tts import gcloud_tts
+    mocker.patch.object(gcloud_tts.texttospeech, "TextToSpeechClient", create=True)
+    return gcloud_tts
+
+
+def test_cache_hit_skips_synthesis(tmp_path):
+    """Test identical requests are served from the cache."""
+    tts = CountingTTS(cache_dir=tmp_path / "cache")
+
+    first = tts.synthesize("hello", "chatgpt", tmp_path / "000_chatgpt.wav")
+    second = tts.synthesize("hello", "gemini", tmp_path / "001_gemini.wav")
+
+    assert tts.calls == 1
+    assert second == tmp_path / "001_gemini.wav"
+    assert second.read_text(encoding="utf-8") == first.read_text(encoding="utf-8")
+
+
+def test_cache_key_separates_voices(tmp_path):
+    """Test different voices do not share cache entries."""
+    cache_dir = tmp_path / "cache"
+    CountingTTS(cache_dir, voice="a").synthesize("hi", "x", tmp_path / "a.wav")
+    tts_b = CountingTTS(cache_dir, voice="b")
+    tts_b.synthesize("hi", "x", tmp_path / "b.wav")
+
+    assert tts_b.calls == 1
+    assert (tmp_path / "b.wav").read_text(encoding="utf-8") == "b:hi"
+    assert len(list(cache_dir.glob("*.wav"))) == 2
+
+
+def test_cache_disabled_without_cache_dir(tmp_path):
+    """Test providers without cache_dir always synthesize."""
+    tts = CountingTTS()
+
+    tts.synthesize("hello", "chatgpt", tmp_path / "a.wav")
+    tts.synthesize("hello", "chatgpt", tmp_path / "b.wav")
+
+    assert tts.calls == 2
+    assert not list(Path(tmp_path).glob("**/.*.tmp"))
+
+
+def test_cache_pruned_as_entries_are_added(tmp_path):
+    """Test synthesize keeps only the most recently used entries."""
+    cache_dir = tmp_path / "cache"
+    tts = CountingTTS(cache_dir=cache_dir)
+    tts.MAX_CACHED_FILES = 2
+    for i, text in enumerate(["old", "hit"]):
+        tts.synthesize(text, "x", tmp_path / f"{i}.wav")
+        os.utime(cache_dir / f"a-{text}.wav", (i, i))
+
+    tts.synthesize("hit", "x", tmp_path / "again.wav")
+    tts.synthesize("new", "x", tmp_path / "new.wav")
+
+    assert tts.calls == 3
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["a-hit.wav", "a-new.wav"]
+
+
+def test_gcloud_cache_key_follows_request(gcloud_tts):
+    """Test the key covers the sent SSML, voice settings and audio format."""
+    provider_cls = gcloud_tts.GoogleCloudTTSProvider
+    text = "本質を探求する"
+    output_path = Path("000_chatgpt.wav")
+    key = provider_cls()._cache_key(text, "chatgpt", output_path)
+
+    assert provider_cls()._cache_key(text, "gemini", output_path) == key
+    assert provider_cls(speaking_rate=1.2)._cache_key(text, "chatgpt", output_path) != key
+    assert provider_cls(pitch=2.0)._cache_key(text, "chatgpt", output_path) != key
+
+    with mock.patch.dict(gcloud_tts.READING_CORRECTIONS, {"本質": "ホンシチ"}):
+        assert provider_cls()._cache_key(text, "chatgpt", output_path) != key
+    with mock.patch.object(provider_cls, "SAMPLE_RATE_HERTZ", 48000):
+        assert provider_cls()._cache_key(text, "chatgpt", output_path) != key
@@ -0,0 +1,198 @@
+"""
+Test video filter graph, render command and render cache.
+"""
+import os
+import subprocess
+import wave
+from pathlib import Path
+
+import pytest
+
+from src.agents.debate_orchestrator import DebateLine, DebateScript
+from src.video.video_generator import VideoGenerator, escape_filter_value
+
+
+@pytest.fixture
+def segments():
+    """Create sample segment list."""
+    return [
+        {"speaker": "chatgpt", "avatar": Path("a.png"), "start": 0.0,
+         "duration": 1.5, "frames": 45, "text": "one"},
+        {"speaker": "gemini", "avatar": Path("b.png"), "start": 1.5,
+         "duration": 2.0, "frames": 60, "text": "two"},
+        {"speaker": "chatgpt", "avatar": Path("a.png"), "start": 3.5,
+         "duration": 1.0, "frames": 30, "text": "three"},
+    ]
+
+
+@pytest.fixture
+def render(tmp_path, mocker):
+    """Create generator, audio and output with FFmpeg mocked out."""
+    audio = tmp_path / "episode.mp3"
+    audio.write_bytes(b"audio")
+    output = tmp_path / "episode.mp4"
+
+    def fake_ffmpeg(cmd, **kwargs):
+        Path(cmd[-1]).write_bytes(b"video")
+
+    run = mocker.patch(
+        "src.video.video_generator.subprocess.run",
+        side_effect=fake_ffmpeg
+    )
+    gen = VideoGenerator(tmp_path / "video", {}, fps=30)
+    return gen, audio, output, run
+
+
+def test_filter_graph_uses_one_input_per_speaker(tmp_path, segments):
+    """Test each speaker still is an input once and split per segment."""
+    gen = VideoGenerator(tmp_path, {}, fps=30)
+    stills, graph = gen._build_filter_graph(segments)
+
+    assert stills == [Path("a.png"), Path("b.png")]
+    assert graph.count("drawtext=") == 2
+    assert "split=2[s0_0][s0_1]" in graph
+    assert "split=1[s1_0]" in graph
+
+
+def test_filter_graph_loops_frames_per_segment(tmp_path, segments):
+    """Test segments repeat a single frame for their duration."""
+    gen = VideoGenerator(tmp_path, {}, fps=30)
+    _, graph = gen._build_filter_graph(segments)
+
+    assert "[s0_0]loop=loop=44:size=1:start=0" in graph
+    assert "[s1_0]loop=loop=59:size=1:start=0" in graph
+    assert "[s0_1]loop=loop=29:size=1:start=0" in graph
+    assert graph.endswith("[v0][v1][v2]concat=n=3:v=1:a=0[outv]")
+
+
+def test_wav_duration_read_without_ffprobe(tmp_path, mocker):
+    """Test WAV stem durations come from the header, not a subprocess."""
+    stem = tmp_path / "000_chatgpt.wav"
+    with wave.open(str(stem), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(24000)
+        wav.writeframes(b"\x00\x00" * 36000)
+
+    run = mocker.patch("src.video.video_generator.subprocess.run")
+    gen = VideoGenerator(tmp_path, {})
+
+    assert gen._get_audio_durations([stem]) == [pytest.approx(1.5)]
+    run.assert_not_called()
+
+
+def test_non_wav_durations_probed_in_order(tmp_path, mocker):
+    """Test FFprobe fallbacks keep the order of the input files."""
+    files = [tmp_path / f"{i:03d}_chatgpt.mp3" for i in range(4)]
+    gen = VideoGenerator(tmp_path, {})
+    probe = mocker.patch.object(
+        gen,
+        "_probe_audio_duration",
+        side_effect=lambda path: float(path.name[:3]) + 0.5
+    )
+
+    assert gen._get_audio_durations(files) == [0.5, 1.5, 2.5, 3.5]
+    assert probe.call_count == 4
+    assert gen._process_count == 4
+
+
+def test_speaker_labels_read_from_text_files(tmp_path, segments):
+    """Test drawtext reads names from files instead of inline text."""
+    gen = VideoGenerator(tmp_path, {}, fps=30)
+    _, graph = gen._build_filter_graph(segments)
+
+    assert "text='" not in graph
+    assert (tmp_path / "name_chatgpt.txt").read_text(encoding="utf-8") == "CHATGPT"
+    assert f"textfile={escape_filter_value(str(tmp_path / 'name_gemini.txt'))}:" in graph
+
+
+def test_escape_filter_value():
+    """Test option and filter graph special characters are escaped."""
+    assert escape_filter_value("/tmp/plain.txt") == "/tmp/plain.txt"
+    assert escape_filter_value("C:/a,b") == "C\\\\:/a\\,b"
+    assert escape_filter_value("it's[1];") == "it\\\\\\'s\\[1\\]\\;"
+
+
+def test_render_skipped_when_unchanged(render, segments):
+    """Test an identical re-render reuses the existing output."""
+    gen, audio, output, run = render
+
+    gen._render_video(segments, audio, output)
+    gen._render_video(segments, audio, output)
+    assert run.call_count == 1
+
+    changed = [{**segments[0], "duration": 2.0, "frames": 60}] + segments[1:]
+    gen._render_video(changed, audio, output)
+    assert run.call_count == 2
+
+
+def test_render_key_follows_audio_content(render, segments):
+    """Test a rewritten but identical mix still reuses the output."""
+    gen, audio, output, run = render
+
+    gen._render_video(segments, audio, output)
+    audio.write_bytes(b"audio")
+    os.utime(audio, ns=(0, 0))
+    gen._render_video(segments, audio, output)
+    assert run.call_count == 1
+
+    audio.write_bytes(b"other")
+    gen._render_video(segments, audio, output)
+    assert run.call_count == 2
+
+
+def test_failed_render_drops_key(render, segments):
+    """Test a failed encode never leaves a key that matches later."""
+    gen, audio, output, run = render
+    key_file = output.with_name(f"{output.name}.key")
+
+    gen._render_video(segments, audio, output)
+    assert key_file.exists()
+
+    def failing_ffmpeg(cmd, **kwargs):
+        Path(cmd[-1]).write_bytes(b"partial")
+        raise subprocess.CalledProcessError(1, cmd, stderr="boom")
+
+    fake_ffmpeg = run.side_effect
+    run.side_effect = failing_ffmpeg
+    changed = [{**segments[0], "duration": 2.0, "frames": 60}] + segments[1:]
+    with pytest.raises(RuntimeError):
+        gen._render_video(changed, audio, output)
+    assert not key_file.exists()
+
+    run.side_effect = fake_ffmpeg
+    gen._render_video(segments, audio, output)
+    assert run.call_count == 3
+
+
+def test_still_inputs_read_at_output_frame_rate(render, segments):
+    """Test stills are read at fps so setpts counts whole frames."""
+    gen, audio, output, run = render
+
+    gen._render_video(segments, audio, output)
+
+    cmd = run.call_args.args[0]
+    for still in ("a.png", "b.png"):
+        i = cmd.index(still)
+        assert cmd[i - 3:i] == ["-framerate", "30", "-i"]
+
+
+def test_segment_boundaries_snap_to_frames(tmp_path):
+    """Test segment lengths follow the rounded running total."""
+    lines = [DebateLine("chatgpt", "x", 0.41, 0.1) for _ in range(3)]
+    script = DebateScript("t", "s", lines, 1.53)
+    gen = VideoGenerator(tmp_path, {}, fps=30)
+
+    segments = gen._create_segment_list(script, {"chatgpt": Path("a.png")})
+
+    # Per-segment rounding would give 15 + 15 + 15 and drift by a frame
+    assert [seg["frames"] for seg in segments] == [15, 16, 15]
+    assert sum(seg["frames"] for seg in segments) == round(1.53 * 30)
+    assert segments[1]["start"] == pytest.approx(15 / 30)
+    assert segments[2]["duration"] == pytest.approx(15 / 30)
+
+    # The graph repeats exactly those frames in a 1/fps time base
+    _, graph = gen._build_filter_graph(segments)
+    assert "[s0_0]loop=loop=14:size=1:start=0,setpts=N/(30*TB)[v0]" in graph
+    assert "[s0_1]loop=loop=15:size=1:start=0,setpts=N/(30*TB)[v1]" in graph
+    assert "[s0_2]loop=loop=14:size=1:start=0,setpts=N/(30*TB)[v2]" in graph